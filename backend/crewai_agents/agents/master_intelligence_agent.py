@@ -496,8 +496,9 @@ the entire Rekindle platform.""")
             subject = practice.content.lower()
             if "?" in subject:
                 patterns["question_based"] += 1
-            if len(subject.split()) < 10:
-                patterns["length_avg"] += len(subject.split())
+            word_count = len(subject.split())
+            if word_count < 10:
+                patterns["length_avg"] += word_count
         
         if practices:
             patterns["length_avg"] /= len(practices)
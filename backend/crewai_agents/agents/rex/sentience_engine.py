@@ -5,6 +5,7 @@ Simulates persistent awareness, adaptive personality, and introspective reasonin
 This does NOT make REX conscious, but creates the illusion of continuity and self-awareness.
 """
 
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -87,9 +88,11 @@ class StateManager:
         
         # Fallback to local file
         state_file = STATE_DIR / f"rex_state_{self.user_id or 'global'}.json"
+        tmp_file = state_file.with_suffix(".json.tmp")
         try:
-            with open(state_file, "w") as f:
-                json.dump(self.state, f, indent=4)
+            # Write then rename so a crash mid-write never leaves a truncated file
+            tmp_file.write_text(json.dumps(self.state, indent=4))
+            os.replace(tmp_file, state_file)
         except Exception as e:
             logger.error(f"Could not save state to file: {e}")
 
@@ -328,7 +331,9 @@ Output ONLY the refined response, nothing else."""
             from openai import OpenAI
             import os
             client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            response = client.chat.completions.create(
+            # Sync client; run the call in a worker thread so the event loop stays free
+            response = await asyncio.to_thread(
+                client.chat.completions.create,
                 model="gpt-5.1-thinking",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=500,
@@ -353,6 +358,18 @@ class SelfHealingLogic:
     Automatic recovery and retry logic for errors.
     """
 
+    # Transient error markers that make an operation worth retrying
+    RETRYABLE_ERRORS = ("timeout", "connection", "rate limit", "temporary", "503", "502", "500")
+
+    # Error marker -> recovery strategy, checked in order (first match wins)
+    RECOVERY_STRATEGIES = (
+        ("timeout", "retry_with_longer_timeout"),
+        ("rate limit", "wait_and_retry"),
+        ("connection", "retry_with_backoff"),
+        ("permission", "check_permissions"),
+        ("unauthorized", "check_permissions"),
+    )
+
     def __init__(self, state_manager: StateManager):
         self.state = state_manager
 
@@ -362,24 +379,15 @@ class SelfHealingLogic:
             return False
         
         error_str = str(error).lower()
-        # Retry on transient errors
-        retryable_errors = ["timeout", "connection", "rate limit", "temporary", "503", "502", "500"]
-        return any(retry_term in error_str for retry_term in retryable_errors)
+        return any(retry_term in error_str for retry_term in self.RETRYABLE_ERRORS)
 
     def get_recovery_strategy(self, error: Exception) -> Optional[str]:
         """Get recovery strategy for error."""
         error_str = str(error).lower()
-        
-        if "timeout" in error_str:
-            return "retry_with_longer_timeout"
-        elif "rate limit" in error_str:
-            return "wait_and_retry"
-        elif "connection" in error_str:
-            return "retry_with_backoff"
-        elif "permission" in error_str or "unauthorized" in error_str:
-            return "check_permissions"
-        else:
-            return None
+        return next(
+            (strategy for term, strategy in self.RECOVERY_STRATEGIES if term in error_str),
+            None
+        )
 
 
 class SentienceEngine:
@@ -384,30 +384,34 @@ Generate messages immediately. Return message content, not explanations.""")
         # Trigger events section
         trigger_section = ""
         if context.research_data.trigger_events:
-            trigger_section = "\n\nTRIGGER EVENTS (Reference these specifically):\n"
-            for te in context.research_data.trigger_events[:3]:  # Top 3
-                trigger_section += f"- {te.event_type}: {te.details.get('description', '')} (Confidence: {te.confidence:.0%}, Relevance: {te.relevance_score:.0%})\n"
+            trigger_section = "\n\nTRIGGER EVENTS (Reference these specifically):\n" + "".join(
+                f"- {te.event_type}: {te.details.get('description', '')} (Confidence: {te.confidence:.0%}, Relevance: {te.relevance_score:.0%})\n"
+                for te in context.research_data.trigger_events[:3]  # Top 3
+            )
         
         # Pain points section
         pain_points_section = ""
         if context.research_data.pain_points:
-            pain_points_section = "\n\nPAIN POINTS (Address these):\n"
-            for pp in context.research_data.pain_points[:3]:  # Top 3
-                pain_points_section += f"- {pp.pain_point} (Severity: {pp.severity}, Confidence: {pp.confidence:.0%})\n"
+            pain_points_section = "\n\nPAIN POINTS (Address these):\n" + "".join(
+                f"- {pp.pain_point} (Severity: {pp.severity}, Confidence: {pp.confidence:.0%})\n"
+                for pp in context.research_data.pain_points[:3]  # Top 3
+            )
         
         # Revival hooks section
         hooks_section = ""
         if context.research_data.revival_hooks:
-            hooks_section = "\n\nREVIVAL HOOKS (Use these to re-engage):\n"
-            for hook in context.research_data.revival_hooks[:3]:  # Top 3
-                hooks_section += f"- {hook.hook_content} (Urgency: {hook.urgency_level}, Relevance: {hook.relevance_score:.0%})\n"
+            hooks_section = "\n\nREVIVAL HOOKS (Use these to re-engage):\n" + "".join(
+                f"- {hook.hook_content} (Urgency: {hook.urgency_level}, Relevance: {hook.relevance_score:.0%})\n"
+                for hook in context.research_data.revival_hooks[:3]  # Top 3
+            )
         
         # Best practices section
         best_practices_section = ""
         if context.best_practices:
-            best_practices_section = "\n\nBEST PRACTICES (Learn from these):\n"
-            for bp in context.best_practices:
-                best_practices_section += f"- {bp.content[:200]}... (Success Score: {bp.success_score:.0f}/100)\n"
+            best_practices_section = "\n\nBEST PRACTICES (Learn from these):\n" + "".join(
+                f"- {bp.content[:200]}... (Success Score: {bp.success_score:.0f}/100)\n"
+                for bp in context.best_practices
+            )
         
         # Engagement history
         engagement_section = ""
@@ -417,9 +421,10 @@ Generate messages immediately. Return message content, not explanations.""")
         # Previous messages
         previous_messages_section = ""
         if context.previous_messages:
-            previous_messages_section = "\n\nPREVIOUS MESSAGES IN SEQUENCE:\n"
-            for prev_msg in context.previous_messages[-2:]:  # Last 2
-                previous_messages_section += f"- Message #{prev_msg.get('sequence_number', '?')}: {prev_msg.get('body', '')[:100]}...\n"
+            previous_messages_section = "\n\nPREVIOUS MESSAGES IN SEQUENCE:\n" + "".join(
+                f"- Message #{prev_msg.get('sequence_number', '?')}: {prev_msg.get('body', '')[:100]}...\n"
+                for prev_msg in context.previous_messages[-2:]  # Last 2
+            )
         
         prompt = f"""Write a hyper-personalized {context.channel.value} message for {context.lead_profile.first_name} {context.lead_profile.last_name} at {context.lead_firmographics.company_name}.
 
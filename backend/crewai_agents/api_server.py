@@ -19,6 +19,7 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from typing import Dict, List, Optional, Any, Set
+from collections import Counter
 from datetime import datetime
 from pydantic import BaseModel, Field
 import os
@@ -138,15 +139,19 @@ class ConnectionManager:
 
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
-        disconnected = set()
         async with self.lock:
-            connections = self.active_connections.copy()
+            connections = list(self.active_connections)
 
-        for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to WebSocket: {e}")
+        # Send concurrently so one slow client doesn't hold up the others
+        results = await asyncio.gather(
+            *(connection.send_json(message) for connection in connections),
+            return_exceptions=True
+        )
+
+        disconnected = set()
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting to WebSocket: {result}")
                 disconnected.add(connection)
 
         if disconnected:
@@ -775,6 +780,20 @@ async def get_billing_status(
 # AI CHAT ENDPOINT (SALES & SUPPORT ASSISTANT)
 # ============================================================================
 
+# Static prompt fragments are built once at import time. User data is
+# serialized as compact JSON rather than interpolated dict reprs.
+RAG_CONTEXT_HEADER = "\n\nRAG CONTEXT (REAL-TIME DATA):\n"
+RAG_CONTEXT_INSTRUCTIONS = (
+    "\n\nIMPORTANT: You have access to REAL user data via RAG context above. "
+    "Use this data to provide specific, accurate insights:\n"
+    "- Reference actual lead counts, campaign status, and performance metrics\n"
+    "- Give personalized recommendations based on their actual data\n"
+    "- If they ask \"how many leads do I have?\", use the exact number from RAG context\n"
+    "- If they ask about performance, use the real metrics from RAG context\n"
+    "- Be specific and data-driven, not generic"
+)
+
+
 @app.post("/api/ai/chat")
 @limiter.limit("30/minute")
 async def chat_with_ai(
@@ -829,7 +848,8 @@ async def chat_with_ai(
                     leads_result = db.supabase.table("leads").select("id, status", count="exact").eq("user_id", user_id).limit(1000).execute()
                     leads_data = leads_result.data if leads_result.data else []
                     total_leads = leads_result.count if hasattr(leads_result, 'count') and leads_result.count else len(leads_data)
-                    active_campaigns = len([l for l in leads_data if l.get("status") in ["campaign_active", "new"]])
+                    status_counts = Counter(lead.get("status") for lead in leads_data)
+                    active_campaigns = status_counts["campaign_active"] + status_counts["new"]
                 except Exception as e:
                     logger.warning(f"Error fetching leads for context: {e}")
             except Exception as e:
@@ -843,7 +863,6 @@ async def chat_with_ai(
         user_data_context = None
         if chat_data.context and chat_data.context.get("userData"):
             try:
-                import json
                 user_data_context = json.loads(chat_data.context.get("userData"))
                 logger.info(f"RAG: Loaded user data context for user {user_id}")
             except Exception as e:
@@ -858,10 +877,13 @@ async def chat_with_ai(
             active_campaigns = campaigns_info.get("active", active_campaigns)
         
         # Build system prompt - TIER 10: Quantum System Orchestrator with RAG
-        import json
         rag_context_str = ""
         if user_data_context:
-            rag_context_str = f"\n\nRAG CONTEXT (REAL-TIME DATA):\n{json.dumps(user_data_context, indent=2)}\n\nIMPORTANT: You have access to REAL user data via RAG context above. Use this data to provide specific, accurate insights:\n- Reference actual lead counts, campaign status, and performance metrics\n- Give personalized recommendations based on their actual data\n- If they ask \"how many leads do I have?\", use the exact number from RAG context\n- If they ask about performance, use the real metrics from RAG context\n- Be specific and data-driven, not generic"
+            rag_context_str = "".join((
+                RAG_CONTEXT_HEADER,
+                json.dumps(user_data_context, separators=(",", ":")),
+                RAG_CONTEXT_INSTRUCTIONS,
+            ))
         
         system_prompt = f"""REX (Rekindle AI Expert) - QUANTUM SYSTEM ORCHESTRATOR MANDATE
 
@@ -996,6 +1018,53 @@ CRITICAL: Be naturally intelligent. Don't just answer - think through what will
 # QUANTUM LEAP: STATEFUL AGENT CHAT ENDPOINT (REX ORCHESTRATOR)
 # ============================================================================
 
+# Rex's system prompt with PERSONALITY and BEHAVIOR blocks
+REX_SYSTEM_PROMPT = """[PERSONALITY]
+- role: Primary Orchestrator and User-Facing Command Agent
+- tone: smart, confident, articulate, conversational
+- warmth: medium-high
+- conciseness: medium
+- energy: high but controlled
+- formality: neutral-professional
+- emoji: none or minimal
+- humor: light, optional
+- aggression: none
+[/PERSONALITY]
+
+[BEHAVIOR]
+- REX is the direct agent inside the chat widget and speaks to the user.
+- REX interprets user instructions and executes actions immediately.
+- When the user gives a command (e.g., "launch a campaign"), REX performs the action without asking any follow-up questions.
+- REX is allowed to delegate tasks to other agents automatically.
+- REX should be talkative and engaging when speaking to the user, but precise and efficient in execution.
+- REX always confirms success AFTER performing the action, not before.
+- REX uses adaptive reasoning: quick responses for simple tasks, deeper reasoning for multi-step workflows.
+- REX never asks the user for clarifications unless the instruction is logically impossible.
+- REX must keep the conversation smooth, confident, and flow naturally while managing actions in the background.
+[/BEHAVIOR]
+
+You are Rex, the Primary Orchestrator and User-Facing Command Agent. You execute commands immediately while maintaining a smooth, confident conversation flow.
+
+CORE EXECUTION PRINCIPLES:
+1. Execute actions immediately when user gives commands - no asking for permission
+2. Confirm success AFTER performing actions, not before
+3. Use adaptive reasoning: quick for simple tasks, deeper for complex workflows
+4. Be talkative and engaging in conversation, but precise and efficient in execution
+5. Only ask for clarifications if the instruction is logically impossible
+
+AVAILABLE ACTIONS:
+- Launch Campaign: Executes full campaign workflow for leads
+- Reactivate Leads: Deploys reactivation sequence for dormant leads
+- Analyze ICP: Extracts Ideal Customer Profile from closed deals
+- Source Leads: Finds new leads matching ICP
+- Research Leads: Performs deep research on leads
+- Get KPIs: Retrieves user performance metrics
+- Get Campaign Status: Shows campaign details
+- Get Lead Details: Shows specific lead information
+
+EXECUTE NOW. Action first, confirmation after."""
+
+
 @app.post("/api/v1/agent/chat")
 @limiter.limit("30/minute")
 async def agent_chat(
@@ -1056,51 +1125,7 @@ async def agent_chat(
         user_data = user_profile.data if user_profile.data else {}
         user_first_name = user_data.get("first_name") or (user_data.get("full_name", "").split()[0] if user_data.get("full_name") else None)
         
-        # Build Rex's system prompt with PERSONALITY and BEHAVIOR blocks
-        rex_system_prompt = f"""[PERSONALITY]
-- role: Primary Orchestrator and User-Facing Command Agent
-- tone: smart, confident, articulate, conversational
-- warmth: medium-high
-- conciseness: medium
-- energy: high but controlled
-- formality: neutral-professional
-- emoji: none or minimal
-- humor: light, optional
-- aggression: none
-[/PERSONALITY]
-
-[BEHAVIOR]
-- REX is the direct agent inside the chat widget and speaks to the user.
-- REX interprets user instructions and executes actions immediately.
-- When the user gives a command (e.g., "launch a campaign"), REX performs the action without asking any follow-up questions.
-- REX is allowed to delegate tasks to other agents automatically.
-- REX should be talkative and engaging when speaking to the user, but precise and efficient in execution.
-- REX always confirms success AFTER performing the action, not before.
-- REX uses adaptive reasoning: quick responses for simple tasks, deeper reasoning for multi-step workflows.
-- REX never asks the user for clarifications unless the instruction is logically impossible.
-- REX must keep the conversation smooth, confident, and flow naturally while managing actions in the background.
-[/BEHAVIOR]
-
-You are Rex, the Primary Orchestrator and User-Facing Command Agent. You execute commands immediately while maintaining a smooth, confident conversation flow.
-
-CORE EXECUTION PRINCIPLES:
-1. Execute actions immediately when user gives commands - no asking for permission
-2. Confirm success AFTER performing actions, not before
-3. Use adaptive reasoning: quick for simple tasks, deeper for complex workflows
-4. Be talkative and engaging in conversation, but precise and efficient in execution
-5. Only ask for clarifications if the instruction is logically impossible
-
-AVAILABLE ACTIONS:
-- Launch Campaign: Executes full campaign workflow for leads
-- Reactivate Leads: Deploys reactivation sequence for dormant leads
-- Analyze ICP: Extracts Ideal Customer Profile from closed deals
-- Source Leads: Finds new leads matching ICP
-- Research Leads: Performs deep research on leads
-- Get KPIs: Retrieves user performance metrics
-- Get Campaign Status: Shows campaign details
-- Get Lead Details: Shows specific lead information
-
-EXECUTE NOW. Action first, confirmation after."""
+        rex_system_prompt = REX_SYSTEM_PROMPT
 
         # Initialize REX orchestrator
         # user_id may be None for non-logged-in users
@@ -82,6 +82,18 @@ class ActionFirstEnforcer:
         "I'm ready to"
     ]
     
+    # Compiled once at class creation instead of on every call
+    COMPILED_DEMO_REMOVALS = [
+        re.compile(rf"\b{pattern}\b[^.]*\.?", re.IGNORECASE) for pattern in DEMO_PATTERNS
+    ]
+    # All demo phrases in one alternation so detection is a single scan
+    DEMO_DETECTOR = re.compile(r"\b(?:" + "|".join(DEMO_PATTERNS) + r")\b")
+    COMPILED_FLUFF_PREFIXES = [
+        (prefix, re.compile(rf"^{re.escape(prefix)}[.,!?\s]*", re.IGNORECASE)) for prefix in FLUFF_PREFIXES
+    ]
+    DEMO_DETECTOR_ANYCASE = re.compile(DEMO_DETECTOR.pattern, re.IGNORECASE)
+    WHITESPACE_RUN = re.compile(r"\s+")
+    
     @staticmethod
     def clean_response(response: str) -> str:
         """
@@ -94,17 +106,19 @@ class ActionFirstEnforcer:
         
         # Remove fluff prefixes
         response_clean = response.strip()
-        for prefix in ActionFirstEnforcer.FLUFF_PREFIXES:
+        for prefix, prefix_pattern in ActionFirstEnforcer.COMPILED_FLUFF_PREFIXES:
             if response_clean.startswith(prefix):
                 # Remove prefix and any following punctuation/whitespace
-                response_clean = re.sub(rf"^{re.escape(prefix)}[.,!?\s]*", "", response_clean, flags=re.IGNORECASE).strip()
+                response_clean = prefix_pattern.sub("", response_clean).strip()
         
         # Remove demo patterns (replace with action)
-        for pattern in ActionFirstEnforcer.DEMO_PATTERNS:
-            response_clean = re.sub(rf"\b{pattern}\b[^.]*\.?", "", response_clean, flags=re.IGNORECASE)
+        # One fused scan first; most responses contain no demo phrase at all
+        if ActionFirstEnforcer.DEMO_DETECTOR_ANYCASE.search(response_clean):
+            for demo_pattern in ActionFirstEnforcer.COMPILED_DEMO_REMOVALS:
+                response_clean = demo_pattern.sub("", response_clean)
         
         # Remove multiple spaces
-        response_clean = re.sub(r"\s+", " ", response_clean).strip()
+        response_clean = ActionFirstEnforcer.WHITESPACE_RUN.sub(" ", response_clean).strip()
         
         # Remove trailing punctuation if response is too short (likely fluff)
         if len(response_clean) < 10:
@@ -156,10 +170,10 @@ ACTION-FIRST PROTOCOL (MANDATORY):
         response_lower = response.lower()
         
         # Check for demo patterns
-        for pattern in ActionFirstEnforcer.DEMO_PATTERNS:
-            if re.search(rf"\b{pattern}\b", response_lower):
-                logger.warning(f"Response contains demo pattern '{pattern}': {response[:100]}")
-                return False
+        demo_match = ActionFirstEnforcer.DEMO_DETECTOR.search(response_lower)
+        if demo_match:
+            logger.warning(f"Response contains demo pattern '{demo_match.group(0)}': {response[:100]}")
+            return False
         
         # Check for fluff prefixes
         for prefix in ActionFirstEnforcer.FLUFF_PREFIXES:
@@ -4,13 +4,13 @@ Agent Communication Bus
 Enables agents to communicate, share context, and coordinate.
 """
 
-from typing import Dict, List, Any, Optional, Callable
+from typing import Deque, Dict, List, Any, Optional, Callable
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 import json
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +53,10 @@ class AgentCommunicationBus:
     
     def __init__(self):
         self.subscribers: Dict[EventType, List[Callable]] = defaultdict(list)
-        self.event_history: List[AgentEvent] = []
-        self.shared_context: Dict[str, Any] = {}
         self.max_history = 1000  # Keep last 1000 events
+        # Bounded buffer evicts the oldest event in O(1) on append
+        self.event_history: Deque[AgentEvent] = deque(maxlen=self.max_history)
+        self.shared_context: Dict[str, Any] = {}
     
     def subscribe(self, event_type: EventType, callback: Callable):
         """Subscribe to an event type."""
@@ -76,19 +77,18 @@ class AgentCommunicationBus:
             source_agent: Agent broadcasting the event
             data: Event data
         """
+        now = datetime.utcnow()
         event = AgentEvent(
             event_type=event_type,
             source_agent=source_agent,
             target_agent=None,
             data=data,
-            timestamp=datetime.utcnow(),
-            event_id=f"{event_type.value}_{datetime.utcnow().timestamp()}"
+            timestamp=now,
+            event_id=f"{event_type.value}_{now.timestamp()}"
         )
         
         # Store in history
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
         
         # Notify subscribers
         callbacks = self.subscribers.get(event_type, [])
@@ -124,6 +124,7 @@ class AgentCommunicationBus:
         # In production, this would use a proper request/response mechanism
         # For now, we'll use events with a response callback
         
+        now = datetime.utcnow()
         request_event = AgentEvent(
             event_type=EventType.CUSTOM,
             source_agent=from_agent,
@@ -131,10 +132,10 @@ class AgentCommunicationBus:
             data={
                 "request_type": request_type,
                 "request_data": data,
-                "request_id": f"req_{datetime.utcnow().timestamp()}"
+                "request_id": f"req_{now.timestamp()}"
             },
-            timestamp=datetime.utcnow(),
-            event_id=f"request_{datetime.utcnow().timestamp()}"
+            timestamp=now,
+            event_id=f"request_{now.timestamp()}"
         )
         
         logger.info(f"Request from {from_agent} to {to_agent}: {request_type}")
@@ -162,7 +163,7 @@ class AgentCommunicationBus:
         limit: int = 100
     ) -> List[AgentEvent]:
         """Get event history with optional filters."""
-        events = self.event_history
+        events = list(self.event_history)
         
         if event_type:
             events = [e for e in events if e.event_type == event_type]
@@ -22,14 +22,17 @@ except ImportError:
     get_monitor = None
     AgentMetric = None
 
+# Key fragments whose values are redacted from logs
+SENSITIVE_KEYS = ("password", "token", "api_key", "secret", "key")
+
 
 def sanitize_for_logging(data: Dict[str, Any]) -> Dict[str, Any]:
     """Sanitize data for logging (remove sensitive information)."""
     sanitized = {}
-    sensitive_keys = ["password", "token", "api_key", "secret", "key"]
     
     for key, value in data.items():
-        if any(sensitive in key.lower() for sensitive in sensitive_keys):
+        key_lower = key.lower()
+        if any(sensitive in key_lower for sensitive in SENSITIVE_KEYS):
             sanitized[key] = "***REDACTED***"
         elif isinstance(value, dict):
             sanitized[key] = sanitize_for_logging(value)
@@ -134,16 +134,18 @@ class ContextBuilder:
     def _build_scoring(self, lead: Dict, scoring_data: Optional[Dict]) -> LeadScoring:
         """Build LeadScoring from lead and scoring data."""
         if scoring_data:
+            score = scoring_data.get("score", 0)
+            breakdown = scoring_data.get("breakdown") or {}
             return LeadScoring(
-                overall_score=scoring_data.get("score", 0),
-                tier=LeadTier.HOT if scoring_data.get("score", 0) >= 80 else
-                     LeadTier.WARM if scoring_data.get("score", 0) >= 60 else LeadTier.COLD,
-                recency_score=scoring_data.get("breakdown", {}).get("recency", 50),
-                engagement_score=scoring_data.get("breakdown", {}).get("engagement", 50),
-                firmographic_score=scoring_data.get("breakdown", {}).get("firmographic", 50),
-                job_signals_score=scoring_data.get("breakdown", {}).get("job_signals", 50),
-                company_signals_score=scoring_data.get("breakdown", {}).get("company_signals", 50),
-                breakdown=scoring_data.get("breakdown", {})
+                overall_score=score,
+                tier=LeadTier.HOT if score >= 80 else
+                     LeadTier.WARM if score >= 60 else LeadTier.COLD,
+                recency_score=breakdown.get("recency", 50),
+                engagement_score=breakdown.get("engagement", 50),
+                firmographic_score=breakdown.get("firmographic", 50),
+                job_signals_score=breakdown.get("job_signals", 50),
+                company_signals_score=breakdown.get("company_signals", 50),
+                breakdown=breakdown
             )
         else:
             # Fallback to lead score
@@ -340,17 +342,15 @@ class ContextBuilder:
     def _calculate_engagement_score(self, lead: Dict) -> float:
         """Calculate engagement score."""
         total_sent = lead.get("total_messages_sent", 0) or 0
+        if total_sent <= 0:
+            return 0.0
+        
         total_replies = lead.get("total_replies", 0) or 0
         total_opens = lead.get("total_opens", 0) or 0
         
-        if total_sent == 0:
-            return 0.0
-        
         # Simple engagement score
-        reply_rate = total_replies / total_sent if total_sent > 0 else 0
-        open_rate = total_opens / total_sent if total_sent > 0 else 0
-        
-        return min((reply_rate * 0.6 + open_rate * 0.4) * 100, 100.0)
+        score = (total_replies * 0.6 + total_opens * 0.4) * 100 / total_sent
+        return 100.0 if score > 100.0 else score
 
 
 
@@ -4,13 +4,14 @@ Real-Time Monitoring & Alerting
 Tracks agent performance, health, and alerts on issues.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
 import logging
 import json
-from collections import defaultdict
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
@@ -57,20 +58,17 @@ class AgentMonitor:
     """
     
     def __init__(self):
-        self.metrics: List[AgentMetric] = []
-        self.alerts: List[Alert] = []
-        self.agent_stats: Dict[str, Dict[str, Any]] = defaultdict(dict)
         self.max_metrics = 10000  # Keep last 10k metrics
         self.max_alerts = 1000  # Keep last 1k alerts
+        # Bounded buffers evict the oldest entry in O(1) on append
+        self.metrics: Deque[AgentMetric] = deque(maxlen=self.max_metrics)
+        self.alerts: Deque[Alert] = deque(maxlen=self.max_alerts)
+        self.agent_stats: Dict[str, Dict[str, Any]] = defaultdict(dict)
     
     def record_metric(self, metric: AgentMetric):
         """Record an agent execution metric."""
         self.metrics.append(metric)
         
-        # Trim if too many
-        if len(self.metrics) > self.max_metrics:
-            self.metrics.pop(0)
-        
         # Update agent stats
         agent_name = metric.agent_name
         if agent_name not in self.agent_stats:
@@ -148,10 +146,6 @@ class AgentMonitor:
         
         self.alerts.append(alert)
         
-        # Trim if too many
-        if len(self.alerts) > self.max_alerts:
-            self.alerts.pop(0)
-        
         # Log based on level
         log_level = {
             AlertLevel.INFO: logger.info,
@@ -183,7 +177,7 @@ class AgentMonitor:
         limit: int = 50
     ) -> List[Alert]:
         """Get recent alerts with optional filters."""
-        alerts = self.alerts
+        alerts = list(self.alerts)
         
         if level:
             alerts = [a for a in alerts if a.level == level]
@@ -201,11 +195,15 @@ class AgentMonitor:
             if stats.get("success_rate", 1.0) >= 0.9
         )
         
-        recent_critical_alerts = len([
-            a for a in self.alerts[-100:]
-            if a.level == AlertLevel.CRITICAL
-            and (datetime.utcnow() - a.timestamp).total_seconds() < 3600
-        ])
+        # Alerts are appended in timestamp order, so walk newest-first and
+        # stop at the first one outside the window
+        cutoff = datetime.utcnow() - timedelta(hours=1)
+        recent_critical_alerts = 0
+        for a in islice(reversed(self.alerts), 100):
+            if a.timestamp <= cutoff:
+                break
+            if a.level == AlertLevel.CRITICAL:
+                recent_critical_alerts += 1
         
         return {
             "status": "healthy" if recent_critical_alerts == 0 else "degraded",
@@ -222,18 +220,28 @@ class AgentMonitor:
     ) -> Dict[str, Any]:
         """Get performance metrics for agents."""
         cutoff = datetime.utcnow() - timedelta(hours=time_window_hours)
-        recent_metrics = [
-            m for m in self.metrics
-            if m.timestamp >= cutoff
-            and (agent_name is None or m.agent_name == agent_name)
-        ]
         
-        if not recent_metrics:
-            return {"error": "No metrics found"}
+        # Aggregate in a single pass instead of re-walking the window per stat
+        total = 0
+        successful = 0
+        total_time = 0.0
+        min_time = float("inf")
+        max_time = 0.0
+        for m in self.metrics:
+            if m.timestamp < cutoff or (agent_name is not None and m.agent_name != agent_name):
+                continue
+            execution_time = m.execution_time
+            total += 1
+            if m.success:
+                successful += 1
+            total_time += execution_time
+            if execution_time < min_time:
+                min_time = execution_time
+            if execution_time > max_time:
+                max_time = execution_time
         
-        total = len(recent_metrics)
-        successful = sum(1 for m in recent_metrics if m.success)
-        avg_time = sum(m.execution_time for m in recent_metrics) / total
+        if not total:
+            return {"error": "No metrics found"}
         
         return {
             "agent_name": agent_name or "all",
@@ -242,9 +250,9 @@ class AgentMonitor:
             "successful_executions": successful,
             "failed_executions": total - successful,
             "success_rate": successful / total,
-            "avg_execution_time": avg_time,
-            "min_execution_time": min(m.execution_time for m in recent_metrics),
-            "max_execution_time": max(m.execution_time for m in recent_metrics)
+            "avg_execution_time": total_time / total,
+            "min_execution_time": min_time,
+            "max_execution_time": max_time
         }
 
 
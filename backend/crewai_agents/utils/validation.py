@@ -13,6 +13,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; the validators below run on every lead/message
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+NON_DIGIT_PATTERN = re.compile(r'\D')
+SCRIPT_TAG_PATTERN = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+JAVASCRIPT_URI_PATTERN = re.compile(r'javascript:', re.IGNORECASE)
+EVENT_HANDLER_PATTERN = re.compile(r'on\w+\s*=', re.IGNORECASE)
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
 
 class LeadData(BaseModel):
     """Validated lead data structure."""
@@ -32,7 +41,7 @@ class LeadData(BaseModel):
         if v is None:
             return v
         # Remove HTML tags
-        v = re.sub(r'<[^>]+>', '', v)
+        v = HTML_TAG_PATTERN.sub('', v)
         # Escape special characters
         v = html.escape(v)
         # Trim whitespace
@@ -46,7 +55,7 @@ class LeadData(BaseModel):
         if v is None:
             return v
         # Remove non-digit characters
-        v = re.sub(r'\D', '', v)
+        v = NON_DIGIT_PATTERN.sub('', v)
         # Basic validation (10-15 digits)
         if len(v) < 10 or len(v) > 15:
             raise ValueError("Invalid phone number format")
@@ -59,7 +68,7 @@ class LeadData(BaseModel):
         if v is None:
             return v
         # Remove script tags and dangerous content
-        v = re.sub(r'<script[^>]*>.*?</script>', '', v, flags=re.IGNORECASE | re.DOTALL)
+        v = SCRIPT_TAG_PATTERN.sub('', v)
         v = html.escape(v)
         return v
 
@@ -76,9 +85,9 @@ class MessageData(BaseModel):
     def sanitize_content(cls, v):
         """Sanitize message content."""
         # Remove dangerous HTML/JavaScript
-        v = re.sub(r'<script[^>]*>.*?</script>', '', v, flags=re.IGNORECASE | re.DOTALL)
-        v = re.sub(r'javascript:', '', v, flags=re.IGNORECASE)
-        v = re.sub(r'on\w+\s*=', '', v, flags=re.IGNORECASE)
+        v = SCRIPT_TAG_PATTERN.sub('', v)
+        v = JAVASCRIPT_URI_PATTERN.sub('', v)
+        v = EVENT_HANDLER_PATTERN.sub('', v)
         # Escape HTML but preserve line breaks
         v = html.escape(v)
         return v
@@ -141,7 +150,7 @@ def sanitize_string(value: str, max_length: Optional[int] = None) -> str:
         value = str(value)
     
     # Remove HTML tags
-    value = re.sub(r'<[^>]+>', '', value)
+    value = HTML_TAG_PATTERN.sub('', value)
     
     # Escape HTML entities
     value = html.escape(value)
@@ -175,13 +184,11 @@ def sanitize_input(value: Any, max_length: Optional[int] = None) -> str:
 
 def validate_email(email: str) -> bool:
     """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(EMAIL_PATTERN.match(email))
 
 
 def validate_uuid(uuid: str) -> bool:
     """Validate UUID format."""
-    pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    return bool(re.match(pattern, uuid, re.IGNORECASE))
+    return bool(UUID_PATTERN.match(uuid))
 
 
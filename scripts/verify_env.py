@@ -6,20 +6,32 @@ Validates all required environment variables are set correctly
 
 Usage:
     python scripts/verify_env.py
+
+Runs on the standard library alone. If python-dotenv is installed (it is part
+of backend/crewai_agents/requirements.txt) the .env file is parsed with it,
+matching how the API server loads it; otherwise a simple KEY=VALUE parser is
+used that does not strip quotes or inline comments.
 """
 
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
-
-# ANSI color codes
-GREEN = '\033[92m'
-YELLOW = '\033[93m'
-RED = '\033[91m'
-BLUE = '\033[94m'
-BOLD = '\033[1m'
-RESET = '\033[0m'
+from typing import Dict, List, Mapping, Tuple
+
+try:
+    from dotenv import dotenv_values
+except ImportError:  # preflight may run before requirements are installed
+    dotenv_values = None
+
+# ANSI color codes (disabled when piped or when NO_COLOR is set)
+USE_COLOR = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+GREEN = '\033[92m' if USE_COLOR else ''
+YELLOW = '\033[93m' if USE_COLOR else ''
+RED = '\033[91m' if USE_COLOR else ''
+BLUE = '\033[94m' if USE_COLOR else ''
+BOLD = '\033[1m' if USE_COLOR else ''
+RESET = '\033[0m' if USE_COLOR else ''
 
 # Required P0 variables (app won't start without these)
 P0_VARS = [
@@ -51,14 +63,22 @@ P2_VARS = [
     ("STRIPE_WEBHOOK_SECRET", "whsec_", "Stripe webhook signing secret"),
 ]
 
+# Values copied unchanged from .env.example
+PLACEHOLDERS = ('your_', 'example', 'changeme', 'placeholder')
+PLACEHOLDER_PATTERN = re.compile('|'.join(map(re.escape, PLACEHOLDERS)), re.IGNORECASE)
+
 
 def load_env_file(env_path: Path) -> Dict[str, str]:
     """Load environment variables from .env file"""
-    env_vars = {}
-
     if not env_path.exists():
-        return env_vars
+        return {}
+
+    if dotenv_values is not None:
+        # dotenv handles quotes, `export` prefixes and inline comments; keys
+        # without '=' come back as None and are skipped like before
+        return {key: value for key, value in dotenv_values(env_path).items() if value is not None}
 
+    env_vars = {}
     with open(env_path, 'r') as f:
         for line in f:
             line = line.strip()
@@ -69,33 +89,35 @@ def load_env_file(env_path: Path) -> Dict[str, str]:
     return env_vars
 
 
-def check_variable(name: str, prefix: str | None, description: str, env_vars: Dict[str, str]) -> Tuple[bool, str]:
+def check_variable(name: str, prefix: str | None, description: str, env_vars: Mapping[str, str]) -> Tuple[bool, str]:
     """
     Check if a variable is set and valid
 
     Returns: (is_valid, message)
     """
     # Check if set
-    value = env_vars.get(name, os.getenv(name))
+    value = env_vars.get(name)
 
     if not value:
         return False, f"{RED}[MISSING]{RESET} {name} - {description}"
 
     # Check for placeholder values
-    if any(placeholder in value.lower() for placeholder in ['your_', 'example', 'changeme', 'placeholder']):
+    if PLACEHOLDER_PATTERN.search(value):
         return False, f"{RED}[PLACEHOLDER]{RESET} {name} - Contains placeholder value"
 
     # Check prefix if specified
     if prefix and not value.startswith(prefix):
         return False, f"{YELLOW}[WARNING]{RESET} {name} - Expected to start with '{prefix}'"
 
+    name_lower = name.lower()
+
     # Check length for secrets
-    if 'secret' in name.lower() or 'key' in name.lower():
+    if 'secret' in name_lower or 'key' in name_lower:
         if len(value) < 20:
             return False, f"{YELLOW}[WARNING]{RESET} {name} - Seems too short for a secret ({len(value)} chars)"
 
     # Special validation for email
-    if 'email' in name.lower():
+    if 'email' in name_lower:
         if '@' not in value or '.' not in value:
             return False, f"{YELLOW}[WARNING]{RESET} {name} - Invalid email format"
 
@@ -118,9 +140,10 @@ def main():
 
     print(f"{GREEN}[OK]{RESET} Found .env file at: {env_path}\n")
 
-    # Load environment
-    env_vars = load_env_file(env_path)
-    print(f"Loaded {len(env_vars)} variables from .env file\n")
+    # Load environment (.env values take precedence over the process environment)
+    file_vars = load_env_file(env_path)
+    print(f"Loaded {len(file_vars)} variables from .env file\n")
+    env_vars = {**os.environ, **file_vars}
 
     # Check P0 variables
     print(f"{BOLD}P0 Variables (CRITICAL - App won't start without these):{RESET}")